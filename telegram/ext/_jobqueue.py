@@ -21,7 +21,17 @@
 
 import datetime
 import weakref
-from typing import TYPE_CHECKING, Optional, Tuple, Union, cast, overload
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Optional,
+    Tuple,
+    Union,
+    overload,
+)
 
 # We apply a small hack here to make AsyncIOScheduler/Executor work with
 # class based callbacks. See https://github.com/agronholm/apscheduler/issues/583
@@ -36,7 +46,10 @@ from typing import TYPE_CHECKING, Optional, Tuple, Union, cast, overload
 from telegram._utils.asyncio import is_coroutine_function, run_non_blocking
 from apscheduler import util
 
-util.iscoroutinefunction = is_coroutine_function
+# Skip re-patching if our own function is already in place, e.g. when this module is
+# re-imported. Patches by third parties are still overridden
+if getattr(util.iscoroutinefunction, '__module__', None) != is_coroutine_function.__module__:
+    util.iscoroutinefunction = is_coroutine_function
 
 import pytz
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -49,6 +62,24 @@ from telegram.ext._utils.types import JobCallback
 if TYPE_CHECKING:
     from telegram.ext import Dispatcher
     import apscheduler.job  # noqa: F401
+    from apscheduler.triggers.base import BaseTrigger
+
+
+_UTC = pytz.utc
+_now = datetime.datetime.now
+_combine = datetime.datetime.combine
+_timedelta = datetime.timedelta
+_ONE_DAY = _timedelta(days=1)
+_EVERY_DAY = tuple(range(7))
+_EVERY_DAY_OF_WEEK = '0,1,2,3,4,5,6'
+
+
+def _day_of_week(days: Tuple[int, ...]) -> str:
+    # Only the default is precomputed. Caching on `days` would be unsafe, since e.g.
+    # `(0, 1) == (0.0, 1.0)` would map both to the string built for the first one
+    if days is _EVERY_DAY:
+        return _EVERY_DAY_OF_WEEK
+    return ','.join(map(str, days))
 
 
 class JobQueue:
@@ -68,10 +99,7 @@ class JobQueue:
 
     def __init__(self) -> None:
         self._dispatcher: 'Optional[weakref.ReferenceType[Dispatcher]]' = None
-        self.scheduler = AsyncIOScheduler(timezone=pytz.utc)
-
-    def _tz_now(self) -> datetime.datetime:
-        return datetime.datetime.now(self.scheduler.timezone)
+        self.scheduler = AsyncIOScheduler(timezone=_UTC)
 
     @overload
     def _parse_time_input(self, time: None, shift_day: bool = False) -> None:
@@ -92,22 +120,47 @@ class JobQueue:
     ) -> Optional[datetime.datetime]:
         if time is None:
             return None
+        parser = self._TIME_PARSERS.get(type(time))
+        if parser is not None:
+            return parser(self, time, shift_day)
+        # Subclasses of the supported types are rare, so we only check for them here
         if isinstance(time, (int, float)):
-            return self._tz_now() + datetime.timedelta(seconds=time)
+            return self._from_seconds(time, shift_day)
         if isinstance(time, datetime.timedelta):
-            return self._tz_now() + time
+            return self._from_timedelta(time, shift_day)
         if isinstance(time, datetime.time):
-            date_time = datetime.datetime.combine(
-                datetime.datetime.now(tz=time.tzinfo or self.scheduler.timezone).date(), time
-            )
-            if date_time.tzinfo is None:
-                date_time = self.scheduler.timezone.localize(date_time)
-            if shift_day and date_time <= datetime.datetime.now(pytz.utc):
-                date_time += datetime.timedelta(days=1)
-            return date_time
+            return self._from_time(time, shift_day)
         # isinstance(time, datetime.datetime):
         return time
 
+    def _from_seconds(self, time: float, _: bool) -> datetime.datetime:
+        return _now(self.scheduler.timezone) + _timedelta(seconds=time)
+
+    def _from_timedelta(self, time: datetime.timedelta, _: bool) -> datetime.datetime:
+        return _now(self.scheduler.timezone) + time
+
+    def _from_time(self, time: datetime.time, shift_day: bool) -> datetime.datetime:
+        timezone = self.scheduler.timezone
+        now = _now(time.tzinfo or timezone)
+        date_time = _combine(now.date(), time)
+        if date_time.tzinfo is None:
+            date_time = timezone.localize(date_time)
+        if shift_day and date_time <= now:
+            date_time += _ONE_DAY
+        return date_time
+
+    def _from_datetime(self, time: datetime.datetime, _: bool) -> datetime.datetime:
+        return time
+
+    # Maps the exact type of the input of _parse_time_input to the function handling it
+    _TIME_PARSERS: ClassVar[Dict[type, Callable[['JobQueue', Any, bool], datetime.datetime]]] = {
+        int: _from_seconds,
+        float: _from_seconds,
+        datetime.timedelta: _from_timedelta,
+        datetime.datetime: _from_datetime,
+        datetime.time: _from_time,
+    }
+
     def set_dispatcher(self, dispatcher: 'Dispatcher') -> None:
         """Set the dispatcher to be used by this JobQueue.
 
@@ -117,7 +170,7 @@ class JobQueue:
         """
         self._dispatcher = weakref.ref(dispatcher)
         if isinstance(dispatcher.bot, ExtBot) and dispatcher.bot.defaults:
-            self.scheduler.configure(timezone=dispatcher.bot.defaults.tzinfo or pytz.utc)
+            self.scheduler.configure(timezone=dispatcher.bot.defaults.tzinfo or _UTC)
 
     @property
     def dispatcher(self) -> 'Dispatcher':
@@ -175,16 +228,16 @@ class JobQueue:
         if not job_kwargs:
             job_kwargs = {}
 
-        name = name or callback.__name__
+        dispatcher = self.dispatcher
         job = Job(callback, context, name)
         date_time = self._parse_time_input(when, shift_day=True)
 
         j = self.scheduler.add_job(
             job,
-            name=name,
+            name=job.name,
             trigger='date',
             run_date=date_time,
-            args=(self.dispatcher,),
+            args=(dispatcher,),
             timezone=date_time.tzinfo or self.scheduler.timezone,
             **job_kwargs,
         )
@@ -261,7 +314,7 @@ class JobQueue:
         if not job_kwargs:
             job_kwargs = {}
 
-        name = name or callback.__name__
+        dispatcher = self.dispatcher
         job = Job(callback, context, name)
 
         dt_first = self._parse_time_input(first)
@@ -276,11 +329,11 @@ class JobQueue:
         j = self.scheduler.add_job(
             job,
             trigger='interval',
-            args=(self.dispatcher,),
+            args=(dispatcher,),
             start_date=dt_first,
             end_date=dt_last,
             seconds=interval,
-            name=name,
+            name=job.name,
             **job_kwargs,
         )
 
@@ -331,14 +384,14 @@ class JobQueue:
         if not job_kwargs:
             job_kwargs = {}
 
-        name = name or callback.__name__
+        dispatcher = self.dispatcher
         job = Job(callback, context, name)
 
         j = self.scheduler.add_job(
             job,
             trigger='cron',
-            args=(self.dispatcher,),
-            name=name,
+            args=(dispatcher,),
+            name=job.name,
             day='last' if day == -1 else day,
             hour=when.hour,
             minute=when.minute,
@@ -353,7 +406,7 @@ class JobQueue:
         self,
         callback: JobCallback,
         time: datetime.time,
-        days: Tuple[int, ...] = tuple(range(7)),
+        days: Tuple[int, ...] = _EVERY_DAY,
         context: object = None,
         name: str = None,
         job_kwargs: JSONDict = None,
@@ -389,15 +442,15 @@ class JobQueue:
         if not job_kwargs:
             job_kwargs = {}
 
-        name = name or callback.__name__
+        dispatcher = self.dispatcher
         job = Job(callback, context, name)
 
         j = self.scheduler.add_job(
             job,
-            name=name,
-            args=(self.dispatcher,),
+            name=job.name,
+            args=(dispatcher,),
             trigger='cron',
-            day_of_week=','.join([str(d) for d in days]),
+            day_of_week=_day_of_week(days),
             hour=time.hour,
             minute=time.minute,
             second=time.second,
@@ -433,10 +486,10 @@ class JobQueue:
             queue.
 
         """
-        name = name or callback.__name__
+        dispatcher = self.dispatcher
         job = Job(callback, context, name)
 
-        j = self.scheduler.add_job(job, args=(self.dispatcher,), name=name, **job_kwargs)
+        j = self.scheduler.add_job(job, args=(dispatcher,), name=job.name, **job_kwargs)
 
         job.job = j
         return job
@@ -459,16 +512,18 @@ class JobQueue:
 
     def jobs(self) -> Tuple['Job', ...]:
         """Returns a tuple of all *scheduled* jobs that are currently in the :class:`JobQueue`."""
-        return tuple(
-            Job._from_aps_job(job)  # pylint: disable=protected-access
-            for job in self.scheduler.get_jobs()
-        )
+        # The APS jobs are wrappers for our jobs, so we can just access `func` directly.
+        # Building a list first is intentional, since tuple() converts lists faster than generators
+        # pylint: disable=consider-using-generator
+        return tuple([job.func for job in self.scheduler.get_jobs()])
 
     def get_jobs_by_name(self, name: str) -> Tuple['Job', ...]:
         """Returns a tuple of all *pending/scheduled* jobs with the given name that are currently
         in the :class:`JobQueue`.
         """
-        return tuple(job for job in self.jobs() if job.name == name)
+        # See jobs() for why we build a list first
+        # pylint: disable=consider-using-generator
+        return tuple([job.func for job in self.scheduler.get_jobs() if job.func.name == name])
 
 
 class Job:
@@ -476,8 +531,8 @@ class Job:
     With the current backend APScheduler, :attr:`job` holds a :class:`apscheduler.job.Job`
     instance.
 
-    Objects of this class are comparable in terms of equality. Two objects of this class are
-    considered equal, if their :attr:`id` is equal.
+    Objects of this class are comparable in terms of equality and hashable. Two objects of this
+    class are considered equal, if their :attr:`id` is equal.
 
     Note:
         * All attributes and instance methods of :attr:`job` are also directly available as
@@ -488,7 +543,8 @@ class Job:
           this :class:`telegram.ext.Job` to be useful.
 
     .. versionchanged:: 14.0
-        Removed argument and attribute :attr:`job_queue`.
+        * Removed argument and attribute :attr:`job_queue`.
+        * Objects of this class are now hashable.
 
     Args:
         callback (:obj:`callable`): The callback function that should be executed by the new job.
@@ -529,7 +585,7 @@ class Job:
         self._removed = False
         self._enabled = False
 
-        self.job = cast(APSJob, job)  # skipcq: PTC-W0052
+        self.job: APSJob = job
 
     async def run(self, dispatcher: 'Dispatcher') -> None:
         """Executes the callback function independently of the jobs schedule. Also calls
@@ -608,9 +664,42 @@ class Job:
         """
         return self.job.next_run_time
 
-    @classmethod
-    def _from_aps_job(cls, job: APSJob) -> 'Job':
-        return job.func
+    # The following attributes of the APS job are accessed frequently, so we forward them
+    # explicitly instead of going through __getattr__
+
+    @property
+    def id(self) -> str:  # pylint: disable=invalid-name
+        """:obj:`str`: Shortcut for :attr:`apscheduler.job.Job.id`.
+
+        .. versionadded:: 14.0
+        """
+        return self.job.id
+
+    @property
+    def next_run_time(self) -> Optional[datetime.datetime]:
+        """:class:`datetime.datetime`: Shortcut for :attr:`apscheduler.job.Job.next_run_time`.
+        Same as :attr:`next_t`, see there for details.
+
+        .. versionadded:: 14.0
+        """
+        return self.job.next_run_time
+
+    @property
+    def trigger(self) -> 'BaseTrigger':
+        """:class:`apscheduler.triggers.base.BaseTrigger`: Shortcut for
+        :attr:`apscheduler.job.Job.trigger`.
+
+        .. versionadded:: 14.0
+        """
+        return self.job.trigger
+
+    @property
+    def pending(self) -> bool:
+        """:obj:`bool`: Shortcut for :attr:`apscheduler.job.Job.pending`.
+
+        .. versionadded:: 14.0
+        """
+        return self.job.pending
 
     def __getattr__(self, item: str) -> object:
         try:
@@ -620,10 +709,32 @@ class Job:
                 f"Neither 'telegram.ext.Job' nor 'apscheduler.job.Job' has attribute '{item}'"
             ) from exc
 
+    # Jobs don't have a meaningful order, so all of them are treated as equivalent when sorting
+
     def __lt__(self, other: object) -> bool:
-        return False
+        if isinstance(other, Job):
+            return False
+        return NotImplemented
+
+    def __le__(self, other: object) -> bool:
+        if isinstance(other, Job):
+            return True
+        return NotImplemented
+
+    def __gt__(self, other: object) -> bool:
+        if isinstance(other, Job):
+            return False
+        return NotImplemented
+
+    def __ge__(self, other: object) -> bool:
+        if isinstance(other, Job):
+            return True
+        return NotImplemented
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, self.__class__):
             return self.id == other.id
         return False
+
+    def __hash__(self) -> int:
+        return hash(self.id)
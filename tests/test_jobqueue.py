@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2022
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import datetime
+import gc
+
+import pytest
+import pytz
+
+from telegram.ext import Job, JobQueue
+
+
+class FakeDispatcher:
+    # Just enough of a dispatcher for scheduling jobs without running them
+    bot = None
+
+
+def job_callback(_):
+    pass
+
+
+def assert_close(date_time, expected):
+    assert date_time.tzinfo is not None
+    assert abs(date_time - expected) < datetime.timedelta(seconds=1)
+
+
+@pytest.fixture(scope='function')
+def dispatcher():
+    return FakeDispatcher()
+
+
+@pytest.fixture(scope='function')
+def job_queue(dispatcher):
+    jq = JobQueue()
+    jq.set_dispatcher(dispatcher)
+    return jq
+
+
+class TestJobQueue:
+    def test_slot_behaviour(self, job_queue, mro_slots):
+        for attr in job_queue.__slots__:
+            assert getattr(job_queue, attr, 'err') != 'err', f"got extra slot '{attr}'"
+        assert len(mro_slots(job_queue)) == len(set(mro_slots(job_queue))), "duplicate slot"
+
+    def test_parse_time_input_follows_scheduler_timezone(self, job_queue):
+        tz = pytz.timezone('Asia/Tokyo')
+        job_queue.scheduler.configure(timezone=tz)
+
+        date_time = job_queue._parse_time_input(datetime.time(12, 0))
+        assert date_time.tzinfo.zone == 'Asia/Tokyo'
+        assert date_time.time() == datetime.time(12, 0)
+        assert job_queue._parse_time_input(1).tzinfo.zone == 'Asia/Tokyo'
+
+        job = job_queue.run_daily(job_callback, datetime.time(12, 0))
+        assert job.trigger.timezone == tz
+
+    def test_no_dispatcher(self):
+        with pytest.raises(RuntimeError, match='No dispatcher was set'):
+            JobQueue().run_once(job_callback, 10)
+
+    def test_dispatcher_is_weakly_referenced(self):
+        job_queue = JobQueue()
+        dispatcher = FakeDispatcher()
+        job_queue.set_dispatcher(dispatcher)
+        assert job_queue.dispatcher is dispatcher
+
+        del dispatcher
+        gc.collect()
+        with pytest.raises(RuntimeError, match='no longer alive'):
+            job_queue.run_once(job_callback, 10)
+
+    @pytest.mark.parametrize(
+        'days, expected',
+        [
+            ((0, 2), '0,2'),
+            ([1, 3], '1,3'),
+        ],
+    )
+    def test_run_daily_days(self, job_queue, days, expected):
+        job = job_queue.run_daily(job_callback, datetime.time(12, 0), days=days)
+        day_of_week = next(f for f in job.trigger.fields if f.name == 'day_of_week')
+        assert str(day_of_week) == expected
+
+    def test_run_daily_every_day(self, job_queue):
+        default = job_queue.run_daily(job_callback, datetime.time(12, 0))
+        # Equal to the default, but not the same object, so the precomputed string isn't used
+        explicit = job_queue.run_daily(job_callback, datetime.time(12, 0), days=tuple(range(7)))
+        for job in (default, explicit):
+            day_of_week = next(f for f in job.trigger.fields if f.name == 'day_of_week')
+            assert str(day_of_week) == '0,1,2,3,4,5,6'
+
+    @pytest.mark.parametrize('seconds', [5, 5.5])
+    def test_parse_time_input_seconds(self, job_queue, seconds):
+        expected = datetime.datetime.now(pytz.utc) + datetime.timedelta(seconds=seconds)
+        assert_close(job_queue._parse_time_input(seconds), expected)
+
+    def test_parse_time_input_timedelta(self, job_queue):
+        expected = datetime.datetime.now(pytz.utc) + datetime.timedelta(minutes=1)
+        assert_close(job_queue._parse_time_input(datetime.timedelta(minutes=1)), expected)
+
+    def test_parse_time_input_datetime(self, job_queue):
+        date_time = datetime.datetime(2030, 1, 1, tzinfo=pytz.utc)
+        assert job_queue._parse_time_input(date_time) is date_time
+
+    def test_parse_time_input_time(self, job_queue):
+        past = (datetime.datetime.now(pytz.utc) - datetime.timedelta(minutes=1)).time()
+        today = job_queue._parse_time_input(past)
+        shifted = job_queue._parse_time_input(past, shift_day=True)
+        assert today.tzinfo is not None
+        assert shifted > datetime.datetime.now(pytz.utc)
+        # Right after midnight, `past` is already in the future and won't be shifted
+        assert shifted - today in (datetime.timedelta(0), datetime.timedelta(days=1))
+
+    def test_parse_time_input_none(self, job_queue):
+        assert job_queue._parse_time_input(None) is None
+
+    def test_parse_time_input_subclasses(self, job_queue):
+        class IntSubclass(int):
+            pass
+
+        class TimedeltaSubclass(datetime.timedelta):
+            pass
+
+        class DatetimeSubclass(datetime.datetime):
+            pass
+
+        class TimeSubclass(datetime.time):
+            pass
+
+        now = datetime.datetime.now(pytz.utc)
+        in_five_seconds = now + datetime.timedelta(seconds=5)
+        assert_close(job_queue._parse_time_input(IntSubclass(5)), in_five_seconds)
+        assert_close(job_queue._parse_time_input(True), now + datetime.timedelta(seconds=1))
+        assert_close(job_queue._parse_time_input(TimedeltaSubclass(seconds=5)), in_five_seconds)
+        date_time = DatetimeSubclass(2030, 1, 1, tzinfo=pytz.utc)
+        assert job_queue._parse_time_input(date_time) is date_time
+        assert job_queue._parse_time_input(TimeSubclass(12, 0)) == job_queue._parse_time_input(
+            datetime.time(12, 0)
+        )
+
+    def test_get_jobs_by_name(self, job_queue):
+        def other_callback(_):
+            pass
+
+        a = job_queue.run_once(job_callback, 10)
+        b = job_queue.run_repeating(job_callback, 10, name='custom')
+        c = job_queue.run_once(other_callback, 10)
+        d = job_queue.run_custom(job_callback, {'trigger': 'interval', 'seconds': 3})
+
+        assert job_queue.jobs() == (a, b, c, d)
+        assert job_queue.get_jobs_by_name('job_callback') == (a, d)
+        assert job_queue.get_jobs_by_name('custom') == (b,)
+        assert job_queue.get_jobs_by_name('other_callback') == (c,)
+        assert job_queue.get_jobs_by_name('missing') == ()
+
+
+class TestJob:
+    def test_comparisons(self, job_queue):
+        a = job_queue.run_once(job_callback, 10)
+        b = job_queue.run_once(job_callback, 5)
+
+        assert not a < b
+        assert not b < a
+        assert a <= b
+        assert b <= a
+        assert not a > b
+        assert a >= b
+        assert sorted([a, b]) == [a, b]
+
+    @pytest.mark.parametrize('other', [5, 'x', None])
+    def test_comparisons_with_other_types(self, job_queue, other):
+        job = job_queue.run_once(job_callback, 10)
+        with pytest.raises(TypeError):
+            job < other
+        with pytest.raises(TypeError):
+            job <= other
+        with pytest.raises(TypeError):
+            job > other
+        with pytest.raises(TypeError):
+            job >= other
+
+    def test_equality_and_hash(self, job_queue):
+        a = job_queue.run_once(job_callback, 10)
+        b = job_queue.run_once(job_callback, 10)
+        a_copy = Job(job_callback, job=a.job)
+
+        assert a == a_copy
+        assert hash(a) == hash(a_copy)
+        assert a != b
+        assert {a, a_copy, b} == {a, b}
+        assert a.id == a.job.id
+
+    def test_equality_and_hash_without_aps_job(self):
+        with pytest.raises(AttributeError, match="Neither 'telegram.ext.Job' nor"):
+            hash(Job(job_callback))
+        with pytest.raises(AttributeError, match="Neither 'telegram.ext.Job' nor"):
+            Job(job_callback) == Job(job_callback)